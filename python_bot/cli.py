@@ -3,94 +3,203 @@
 Command-line interface for WebTestBot.
 
 Usage:
-    python -m python_bot.cli <url> [--bots=N]
+    python -m python_bot.cli <url> [--bots=N] [--no-headless]
 """
 
 import asyncio
 import sys
-import argparse
-from typing import Dict, Any
+import time
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Dict, Any, List, NoReturn, Optional, Tuple
 from python_bot.core.bot import WebBot, BotReport
-from python_bot.config.models import BotConfig
+from python_bot.config.models import BotConfig, BrowserConfig
+
+if TYPE_CHECKING:
+    from playwright.async_api import Browser
 
 
 def print_update(update: Dict[str, Any]) -> None:
     """Print progress update to console."""
     update_type = update.get('type', 'INFO').upper()
     message = update.get('message', '')
-    print(f'[{update_type}] {message}')
+    lines = [f'[{update_type}] {message}']
     
     if 'analysis' in update:
         analysis = update['analysis']
-        print(f'   📊 Analysis: {analysis.link_count} links, {analysis.form_count} forms')
+        lines.append(f'   📊 Analysis: {analysis.link_count} links, {analysis.form_count} forms')
+    
+    sys.stdout.write('\n'.join(lines) + '\n')
 
 
 def print_report(report: BotReport) -> None:
-    """Print detailed test report."""
-    print('\n' + '='*50)
-    print('📋 TEST REPORT')
-    print('='*50)
+    """Print detailed test report with a single write."""
+    lines: List[str] = []
+    append = lines.append
+    
+    append('\n' + '='*50)
+    append('📋 TEST REPORT')
+    append('='*50)
     
-    print(f'\n✅ Success: {report.success}')
-    print(f'📊 Actions: {len(report.actions)}')
-    print(f'❌ Errors: {len(report.errors)}')
+    append(f'\n✅ Success: {report.success}')
+    append(f'📊 Actions: {len(report.actions)}')
+    append(f'❌ Errors: {len(report.errors)}')
     
     if report.performance:
-        print(f'\n⚡ Performance:')
-        print(f'   Load Time: {report.performance.get("load_time", 0):.0f}ms')
-        print(f'   Response Time: {report.performance.get("response_time", 0):.0f}ms')
+        append('\n⚡ Performance:')
+        if 'dom_content_loaded' in report.performance:
+            append(f'   DOMContentLoaded: {report.performance["dom_content_loaded"]:.0f}ms')
+        append(f'   Load Time: {report.performance.get("load_time", 0):.0f}ms')
+        append(f'   Response Time: {report.performance.get("response_time", 0):.0f}ms')
     
     if report.analysis:
-        print(f'\n📄 Page Analysis:')
-        print(f'   Title: {report.analysis.title}')
-        print(f'   URL: {report.analysis.url}')
-        print(f'   Links: {report.analysis.link_count}')
-        print(f'   Forms: {report.analysis.form_count}')
-        print(f'   Buttons: {report.analysis.button_count}')
-        print(f'   Images: {report.analysis.image_count}')
+        append('\n📄 Page Analysis:')
+        append(f'   Title: {report.analysis.title}')
+        append(f'   URL: {report.analysis.url}')
+        append(f'   Links: {report.analysis.link_count}')
+        append(f'   Forms: {report.analysis.form_count}')
+        append(f'   Buttons: {report.analysis.button_count}')
+        append(f'   Images: {report.analysis.image_count}')
     
     if report.errors:
-        print(f'\n❌ Errors:')
+        append('\n❌ Errors:')
         for idx, error in enumerate(report.errors, 1):
-            print(f'   {idx}. {error.get("type")}: {error.get("message")}')
+            append(f'   {idx}. {error.get("type")}: {error.get("message")}')
     
     if report.actions:
-        print(f'\n✅ Actions:')
+        append('\n✅ Actions:')
         for idx, action in enumerate(report.actions, 1):
-            print(f'   {idx}. {action.action_type}: {action.status}')
+            append(f'   {idx}. {action.action_type}: {action.status}')
+    
+    sys.stdout.write('\n'.join(lines) + '\n')
 
 
-async def run_single_bot(url: str, config: BotConfig) -> BotReport:
-    """Run a single bot test."""
-    bot = WebBot(config)
+async def run_single_bot(
+    url: str,
+    config: BotConfig,
+    browser: Optional["Browser"] = None
+) -> BotReport:
+    """Run a single bot test, optionally on a shared browser."""
+    bot = WebBot(config, browser=browser)
     return await bot.run_test(url, on_update=print_update)
 
 
+USAGE = """usage: cli.py [-h] [--bots BOTS] [--no-headless] [url]
+
+WebTestBot - Python-based web automation and testing
+
+positional arguments:
+  url            Target URL to test (default: hasanarthuraltuntas.com.tr)
+
+options:
+  -h, --help     show this help message and exit
+  --bots BOTS    Number of concurrent bots (default: 1, max: 10)
+  --no-headless  Disable headless mode (run browser with visible window)"""
+
+
+def _usage_error(message: str) -> NoReturn:
+    """Print a usage error and exit with status 2."""
+    print(USAGE.split('\n', 1)[0], file=sys.stderr)
+    print(f'cli.py: error: {message}', file=sys.stderr)
+    sys.exit(2)
+
+
+_OPTIONS = ('--help', '--bots', '--no-headless')
+
+
+def _match_option(name: str) -> Optional[str]:
+    """Resolve an option name, accepting unambiguous prefixes like argparse."""
+    if name == '-h':
+        return '--help'
+
+    if name.startswith('--'):
+        matches = [option for option in _OPTIONS if option.startswith(name)]
+        if name in matches:
+            return name
+        if len(matches) == 1:
+            return matches[0]
+        if matches:
+            _usage_error(
+                f"ambiguous option: {name} could match {', '.join(matches)}"
+            )
+
+    return None
+
+
+def _parse(argv: List[str]) -> SimpleNamespace:
+    """Parse command-line arguments in a single pass over argv."""
+    args = SimpleNamespace(
+        url='https://hasanarthuraltuntas.com.tr',
+        bots=1,
+        headless=True
+    )
+    url_seen = False
+    options_done = False
+    idx = 0
+
+    while idx < len(argv):
+        arg = argv[idx]
+        idx += 1
+
+        if not options_done and arg.startswith('-') and arg != '-':
+            if arg == '--':
+                options_done = True
+                continue
+
+            name, has_value, value = arg.partition('=')
+            option = _match_option(name)
+
+            if option is None:
+                _usage_error(f'unrecognized arguments: {arg}')
+            elif option == '--help':
+                print(USAGE)
+                sys.exit(0)
+            elif option == '--no-headless':
+                if has_value:
+                    _usage_error(
+                        f"argument --no-headless: ignored explicit argument '{value}'"
+                    )
+                args.headless = False
+            else:
+                if not has_value:
+                    if idx >= len(argv):
+                        _usage_error('argument --bots: expected one argument')
+                    value = argv[idx]
+                    idx += 1
+                try:
+                    args.bots = int(value)
+                except ValueError:
+                    _usage_error(f"argument --bots: invalid int value: '{value}'")
+            continue
+
+        if url_seen:
+            _usage_error(f'unrecognized arguments: {arg}')
+        args.url = arg
+        url_seen = True
+
+    return args
+
+
+async def run_numbered_bot(
+    bot_id: int,
+    url: str,
+    config: BotConfig,
+    browser: Optional["Browser"] = None
+) -> Tuple[int, BotReport]:
+    """Run a single bot test and tag its report with the bot number."""
+    try:
+        report = await run_single_bot(url, config, browser)
+    except Exception as error:
+        report = BotReport(success=False, errors=[{
+            'type': 'CRITICAL_ERROR',
+            'message': str(error),
+            'timestamp': time.time()
+        }])
+    return bot_id, report
+
+
 async def main() -> None:
     """Main entry point for CLI."""
-    parser = argparse.ArgumentParser(
-        description='WebTestBot - Python-based web automation and testing'
-    )
-    parser.add_argument(
-        'url',
-        nargs='?',
-        default='https://hasanarthuraltuntas.com.tr',
-        help='Target URL to test (default: hasanarthuraltuntas.com.tr)'
-    )
-    parser.add_argument(
-        '--bots',
-        type=int,
-        default=1,
-        help='Number of concurrent bots (default: 1, max: 10)'
-    )
-    parser.add_argument(
-        '--no-headless',
-        action='store_false',
-        dest='headless',
-        help='Disable headless mode (run browser with visible window)'
-    )
-    
-    args = parser.parse_args()
+    args = _parse(sys.argv[1:])
     
     if not args.url.startswith(('http://', 'https://')):
         print('❌ Error: URL must start with http:// or https://')
@@ -105,23 +214,41 @@ async def main() -> None:
     print(f'🤖 Bots: {args.bots}')
     print()
     
-    config = BotConfig()
-    config.browser.headless = args.headless
+    config = BotConfig(browser=BrowserConfig(headless=args.headless))
     
     if args.bots == 1:
         report = await run_single_bot(args.url, config)
         print_report(report)
     else:
         print(f'🚀 Running {args.bots} concurrent bots...\n')
-        tasks = [run_single_bot(args.url, config) for _ in range(args.bots)]
-        reports = await asyncio.gather(*tasks)
-        
-        for idx, report in enumerate(reports, 1):
-            print(f'\n{"="*50}')
-            print(f'BOT #{idx} REPORT')
-            print_report(report)
+        success_count = 0
+        from playwright.async_api import async_playwright
+
+        playwright = await async_playwright().start()
+        try:
+            browser = await WebBot.launch_browser(playwright, config)
+            tasks = [
+                asyncio.create_task(
+                    run_numbered_bot(bot_id, args.url, config, browser)
+                )
+                for bot_id in range(1, args.bots + 1)
+            ]
+            try:
+                for next_report in asyncio.as_completed(tasks):
+                    bot_id, report = await next_report
+                    print(f'\n{"="*50}')
+                    print(f'BOT #{bot_id} REPORT')
+                    print_report(report)
+                    success_count += report.success
+                    del report
+            finally:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                await browser.close()
+        finally:
+            await playwright.stop()
         
-        success_count = sum(1 for r in reports if r.success)
         print(f'\n{"="*50}')
         print(f'📊 SUMMARY: {success_count}/{args.bots} bots succeeded')
         print('='*50)
@@ -11,11 +11,24 @@ class ViewportConfig(BaseModel):
     width: int = Field(default=1366, ge=800, le=3840)
     height: int = Field(default=768, ge=600, le=2160)
 
+    class Config:
+        """Pydantic configuration."""
+        frozen = True
+
 
 class BrowserConfig(BaseModel):
-    """Browser launch configuration."""
+    """
+    Browser launch configuration.
+
+    block_heavy_resources aborts image, font and media requests. Pages load
+    faster, but images without explicit dimensions no longer take up space,
+    so scroll_height and the scroll target can differ from a normal load.
+    Every request also passes through a Python route handler, and Playwright
+    disables the HTTP cache while routing is active.
+    """
     headless: bool = True
     timeout: int = Field(default=60000, ge=5000, le=120000)
+    block_heavy_resources: bool = False
     args: List[str] = Field(default_factory=lambda: [
         '--no-sandbox',
         '--disable-dev-shm-usage',
@@ -35,10 +48,18 @@ class ContextConfig(BaseModel):
 
 
 class PageConfig(BaseModel):
-    """Page-level configuration."""
+    """
+    Page-level configuration.
+
+    Navigation waits for DOMContentLoaded by default; the bot then waits up to
+    load_timeout ms (0 disables the wait) for the load event before analysis.
+    The reported load time includes that wait. Set wait_until to 'networkidle'
+    for pages that keep fetching content after load.
+    """
     default_timeout: int = Field(default=30000, ge=5000, le=60000)
     navigation_timeout: int = Field(default=30000, ge=5000, le=60000)
-    wait_until: Literal['load', 'domcontentloaded', 'networkidle'] = 'networkidle'
+    wait_until: Literal['load', 'domcontentloaded', 'networkidle'] = 'domcontentloaded'
+    load_timeout: int = Field(default=5000, ge=0, le=60000)
 
 
 class ConcurrencyConfig(BaseModel):
@@ -53,6 +74,10 @@ class ActionConfig(BaseModel):
     enabled: bool = True
     wait_time: int = Field(default=1000, ge=0, le=10000)
 
+    class Config:
+        """Pydantic configuration."""
+        frozen = True
+
 
 class TestingConfig(BaseModel):
     """Testing behavior configuration."""
@@ -62,6 +87,8 @@ class TestingConfig(BaseModel):
     scroll: ActionConfig = Field(default_factory=ActionConfig)
     link_click: ActionConfig = Field(default_factory=lambda: ActionConfig(wait_time=2000))
     form_interaction: ActionConfig = Field(default_factory=lambda: ActionConfig(wait_time=500))
+    collect_link_details: bool = False
+    collect_form_details: bool = False
 
 
 class BotConfig(BaseModel):
@@ -5,24 +5,37 @@ This module demonstrates Python-first approach with superior type safety,
 better error handling, and cleaner architecture.
 """
 
-from typing import Optional, Callable, Dict, List, Any
+from __future__ import annotations
+
+import asyncio
+import sys
+import time
+from typing import TYPE_CHECKING, Optional, Awaitable, Callable, Dict, List, Any, Tuple
 from dataclasses import dataclass, field
-from datetime import datetime
-from playwright.async_api import async_playwright, Browser, BrowserContext, Page, Playwright
 from python_bot.config.models import BotConfig
 
+if TYPE_CHECKING:
+    # Playwright is imported lazily in WebBot.initialize to keep imports cheap.
+    from playwright.async_api import Browser, BrowserContext, Page, Playwright, Route
+
+# Resource types aborted when browser.block_heavy_resources is enabled.
+_HEAVY_RESOURCE_TYPES = frozenset({'image', 'font', 'media'})
+
+# Slotted dataclasses need Python 3.10+; older interpreters keep __dict__.
+_SLOTS: Dict[str, bool] = {'slots': True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class ActionResult:
     """Result of a single action execution."""
     action_type: str
     status: str
     message: str
-    timestamp: datetime = field(default_factory=datetime.now)
+    timestamp: float = field(default_factory=time.time)
     details: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class PageAnalysis:
     """Analysis results for a web page."""
     title: str
@@ -35,11 +48,11 @@ class PageAnalysis:
     has_service_worker: bool
     viewport: Dict[str, int]
     scroll_height: int
-    links: List[Dict[str, str]]
-    forms: List[Dict[str, Any]]
+    links: List[Dict[str, str]] = field(default_factory=list)
+    forms: List[Dict[str, Any]] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class BotReport:
     """Complete test execution report."""
     success: bool
@@ -57,55 +70,119 @@ class WebBot:
     and cleaner separation of concerns compared to Node.js implementation.
     """
 
-    def __init__(self, config: Optional[BotConfig] = None):
-        """Initialize bot with optional configuration."""
+    def __init__(
+        self,
+        config: Optional[BotConfig] = None,
+        browser: Optional[Browser] = None,
+        playwright: Optional[Playwright] = None
+    ):
+        """
+        Initialize bot with optional configuration.
+
+        Args:
+            config: Bot configuration (defaults to BotConfig())
+            browser: Optional shared browser; the bot then only owns its
+                context and page and never closes the browser itself
+            playwright: Optional shared Playwright instance used to launch
+                a browser when none is injected
+        """
         self.config = config or BotConfig()
-        self._browser: Optional[Browser] = None
+        self._browser: Optional[Browser] = browser
         self._context: Optional[BrowserContext] = None
         self._page: Optional[Page] = None
-        self._playwright: Optional[Playwright] = None
+        self._playwright: Optional[Playwright] = playwright
+        self._owns_browser = browser is None
+        self._owns_playwright = playwright is None
+
+    @staticmethod
+    async def launch_browser(playwright: Playwright, config: BotConfig) -> Browser:
+        """Launch Chromium with the browser settings from config."""
+        return await playwright.chromium.launch(
+            headless=config.browser.headless,
+            timeout=config.browser.timeout,
+            args=config.browser.args
+        )
 
     async def initialize(self) -> bool:
         """Initialize browser, context, and page."""
+        if not self._owns_browser:
+            return await self.initialize_context_only()
+
         try:
-            await self.cleanup()
+            if any((self._page, self._context, self._browser, self._playwright)):
+                await self.cleanup()
 
-            self._playwright = await async_playwright().start()
-            
-            self._browser = await self._playwright.chromium.launch(
-                headless=self.config.browser.headless,
-                timeout=self.config.browser.timeout,
-                args=self.config.browser.args
-            )
+            if not self._playwright:
+                from playwright.async_api import async_playwright
+
+                self._playwright = await async_playwright().start()
+
+            self._browser = await self.launch_browser(self._playwright, self.config)
 
             if not self._browser:
                 raise RuntimeError('Browser initialization failed')
 
-            self._context = await self._browser.new_context(
-                user_agent=self.config.context.user_agent,
-                viewport={
-                    'width': self.config.context.viewport.width,
-                    'height': self.config.context.viewport.height
-                }
-            )
+            await self._open_context()
 
-            if not self._context:
-                raise RuntimeError('Context creation failed')
+            return True
 
-            self._page = await self._context.new_page()
+        except Exception as error:
+            print(f'[ERROR] Browser initialization failed: {error}')
+            await self.cleanup()
+            return False
 
-            if not self._page:
-                raise RuntimeError('Page creation failed')
+    async def initialize_context_only(self) -> bool:
+        """Initialize context and page on the injected browser."""
+        try:
+            if self._page or self._context:
+                await self._cleanup_page_context()
 
-            self._page.set_default_timeout(self.config.page.default_timeout)
+            if not self._browser:
+                raise RuntimeError('No browser provided')
+
+            await self._open_context()
 
             return True
 
         except Exception as error:
-            print(f'[ERROR] Browser initialization failed: {error}')
+            print(f'[ERROR] Context initialization failed: {error}')
             await self.cleanup()
             return False
 
+    async def _open_context(self) -> None:
+        """Create an isolated context and page on the current browser."""
+        if not self._browser:
+            raise RuntimeError('Browser not initialized')
+
+        self._context = await self._browser.new_context(
+            user_agent=self.config.context.user_agent,
+            viewport={
+                'width': self.config.context.viewport.width,
+                'height': self.config.context.viewport.height
+            }
+        )
+
+        if not self._context:
+            raise RuntimeError('Context creation failed')
+
+        if self.config.browser.block_heavy_resources:
+            await self._context.route('**/*', self._route_heavy_resources)
+
+        self._page = await self._context.new_page()
+
+        if not self._page:
+            raise RuntimeError('Page creation failed')
+
+        self._page.set_default_timeout(self.config.page.default_timeout)
+
+    @staticmethod
+    async def _route_heavy_resources(route: Route) -> None:
+        """Abort image, font and media requests; let everything else through."""
+        if route.request.resource_type in _HEAVY_RESOURCE_TYPES:
+            await route.abort()
+        else:
+            await route.continue_()
+
     async def run_test(
         self,
         url: str,
@@ -135,13 +212,19 @@ class WebBot:
             if on_update:
                 on_update({'type': 'status', 'message': 'Bot started, navigating...'})
 
-            start_time = datetime.now()
+            start_time = time.perf_counter()
             response = await self._page.goto(
                 url,
                 wait_until=self.config.page.wait_until,
                 timeout=self.config.page.navigation_timeout
             )
-            load_time = (datetime.now() - start_time).total_seconds() * 1000
+            if self.config.page.wait_until == 'domcontentloaded':
+                report.performance['dom_content_loaded'] = (
+                    (time.perf_counter() - start_time) * 1000.0
+                )
+
+            await self.wait_for_load()
+            load_time = (time.perf_counter() - start_time) * 1000.0
 
             report.performance['load_time'] = load_time
             
@@ -162,7 +245,7 @@ class WebBot:
                     'url': self._page.url
                 })
 
-            analysis = await self.analyze_page()
+            analysis, scroll_error = await self.analyze_and_prime_page()
             report.analysis = analysis
 
             if on_update:
@@ -172,7 +255,21 @@ class WebBot:
                     'analysis': analysis
                 })
 
-            await self.perform_automated_actions(report, on_update)
+            if scroll_error is None:
+                report.actions.append(ActionResult(
+                    action_type='SCROLL',
+                    status='SUCCESS',
+                    message='Scrolled to page middle'
+                ))
+
+                if on_update:
+                    on_update({'type': 'action', 'message': 'Page scroll test successful'})
+            else:
+                report.errors.append({
+                    'type': 'AUTOMATION_ERROR',
+                    'message': scroll_error,
+                    'timestamp': time.time()
+                })
 
             for action in actions:
                 try:
@@ -182,7 +279,7 @@ class WebBot:
                         'type': 'ACTION_ERROR',
                         'action': action.get('type'),
                         'message': str(error),
-                        'timestamp': datetime.now()
+                        'timestamp': time.time()
                     })
 
             report.success = len(report.errors) == 0
@@ -191,7 +288,7 @@ class WebBot:
             report.errors.append({
                 'type': 'CRITICAL_ERROR',
                 'message': str(error),
-                'timestamp': datetime.now()
+                'timestamp': time.time()
             })
 
             if on_update:
@@ -205,35 +302,82 @@ class WebBot:
 
         return report
 
-    async def analyze_page(self) -> PageAnalysis:
-        """Analyze current page structure and content."""
+    async def wait_for_load(self) -> None:
+        """
+        Wait up to page.load_timeout ms for the load event.
+
+        Returns immediately if navigation already waited for load, and does
+        not wait at all when load_timeout is 0. A timeout is not an error:
+        analysis proceeds on whatever has loaded so far.
+        """
+        if not self._page or not self.config.page.load_timeout:
+            return
+
+        from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+        try:
+            await self._page.wait_for_load_state(
+                'load',
+                timeout=self.config.page.load_timeout
+            )
+        except PlaywrightTimeoutError:
+            pass
+
+    async def analyze_and_prime_page(self) -> Tuple[PageAnalysis, Optional[str]]:
+        """
+        Analyze the current page and scroll it to the middle in one round-trip.
+
+        The scroll waits for two animation frames inside the page, bounded by
+        testing.scroll.wait_time, instead of a fixed sleep. Link and form
+        details are only serialized when enabled in the testing configuration;
+        counts are always returned.
+
+        Returns:
+            Tuple of page analysis and scroll error message (None on success)
+        """
         if not self._page:
             raise RuntimeError('Page not initialized')
 
         data = await self._page.evaluate("""
-            () => {
-                return {
+            async (opts) => {
+                const anchors = [];
+                const forms = [];
+                let buttonCount = 0;
+                let inputCount = 0;
+                let imageCount = 0;
+
+                for (const el of document.querySelectorAll('a, form, button, input, img')) {
+                    switch (el.localName) {
+                        case 'a': anchors.push(el); break;
+                        case 'form': forms.push(el); break;
+                        case 'button': buttonCount++; break;
+                        case 'input': inputCount++; break;
+                        case 'img': imageCount++; break;
+                    }
+                }
+
+                const analysis = {
                     title: document.title,
                     url: window.location.href,
-                    link_count: document.querySelectorAll('a').length,
-                    form_count: document.querySelectorAll('form').length,
-                    button_count: document.querySelectorAll('button').length,
-                    input_count: document.querySelectorAll('input').length,
-                    image_count: document.querySelectorAll('img').length,
+                    link_count: anchors.length,
+                    form_count: forms.length,
+                    button_count: buttonCount,
+                    input_count: inputCount,
+                    image_count: imageCount,
                     has_service_worker: 'serviceWorker' in navigator,
                     viewport: {
                         width: window.innerWidth,
                         height: window.innerHeight
                     },
                     scroll_height: document.body ? document.body.scrollHeight : 0,
-                    links: Array.from(document.querySelectorAll('a'))
+                    links: !opts.links ? [] : anchors
                         .map(a => ({
                             text: a.textContent.trim(),
                             href: a.href,
                             target: a.target
                         }))
                         .filter(link => link.href && link.text),
-                    forms: Array.from(document.querySelectorAll('form'))
+                    forms: !opts.forms ? [] : forms
                         .map(form => ({
                             action: form.action,
                             method: form.method,
@@ -245,39 +389,27 @@ class WebBot:
                                 }))
                         }))
                 };
-            }
-        """)
-
-        return PageAnalysis(**data)
 
-    async def perform_automated_actions(
-        self,
-        report: BotReport,
-        on_update: Optional[Callable[[Dict[str, Any]], None]] = None
-    ) -> None:
-        """Execute automated testing actions."""
-        if not self._page:
-            return
-
-        try:
-            await self._page.evaluate('window.scrollTo(0, document.body.scrollHeight / 2)')
-            await self._page.wait_for_timeout(1000)
-
-            report.actions.append(ActionResult(
-                action_type='SCROLL',
-                status='SUCCESS',
-                message='Scrolled to page middle'
-            ))
+                let scrollError = null;
+                try {
+                    window.scrollTo(0, document.body.scrollHeight / 2);
+                    await new Promise(resolve => {
+                        requestAnimationFrame(() => requestAnimationFrame(resolve));
+                        setTimeout(resolve, opts.scrollTimeout);
+                    });
+                } catch (error) {
+                    scrollError = String(error);
+                }
 
-            if on_update:
-                on_update({'type': 'action', 'message': 'Page scroll test successful'})
+                return { analysis, scrollError };
+            }
+        """, {
+            'links': self.config.testing.collect_link_details,
+            'forms': self.config.testing.collect_form_details,
+            'scrollTimeout': self.config.testing.scroll.wait_time
+        })
 
-        except Exception as error:
-            report.errors.append({
-                'type': 'AUTOMATION_ERROR',
-                'message': str(error),
-                'timestamp': datetime.now()
-            })
+        return PageAnalysis(**data['analysis']), data['scrollError']
 
     async def perform_action(
         self,
@@ -322,24 +454,39 @@ class WebBot:
             })
 
     async def cleanup(self) -> None:
-        """Clean up browser resources."""
+        """Clean up browser resources, leaving injected ones open."""
+        await self._cleanup_page_context()
+        await self._cleanup_browser_playwright()
+
+    async def _cleanup_page_context(self) -> None:
+        """Close page and context concurrently."""
+        closers: List[Awaitable[None]] = []
+        labels: List[str] = []
+
         if self._page:
-            try:
-                await self._page.close()
-            except Exception as error:
-                print(f'[WARN] Page cleanup error: {error}')
-            finally:
-                self._page = None
+            closers.append(self._page.close())
+            labels.append('Page')
 
         if self._context:
-            try:
-                await self._context.close()
-            except Exception as error:
-                print(f'[WARN] Context cleanup error: {error}')
-            finally:
-                self._context = None
+            closers.append(self._context.close())
+            labels.append('Context')
+
+        if not closers:
+            return
+
+        try:
+            results = await asyncio.gather(*closers, return_exceptions=True)
+        finally:
+            self._page = None
+            self._context = None
+
+        for label, result in zip(labels, results):
+            if isinstance(result, Exception):
+                print(f'[WARN] {label} cleanup error: {result}')
 
-        if self._browser:
+    async def _cleanup_browser_playwright(self) -> None:
+        """Close the browser and stop Playwright if this bot owns them."""
+        if self._browser and self._owns_browser:
             try:
                 await self._browser.close()
             except Exception as error:
@@ -347,7 +494,7 @@ class WebBot:
             finally:
                 self._browser = None
 
-        if self._playwright:
+        if self._playwright and self._owns_playwright:
             try:
                 await self._playwright.stop()
             except Exception as error:
@@ -0,0 +1,58 @@
+"""Tests for the command-line argument parser."""
+
+import pytest
+
+from python_bot.cli import _parse
+
+
+def test_defaults() -> None:
+    args = _parse([])
+    assert args.url == 'https://hasanarthuraltuntas.com.tr'
+    assert args.bots == 1
+    assert args.headless is True
+
+
+def test_bots_separate_value() -> None:
+    assert _parse(['--bots', '3']).bots == 3
+
+
+def test_bots_inline_value() -> None:
+    assert _parse(['--bots=4']).bots == 4
+
+
+def test_option_prefixes() -> None:
+    args = _parse(['--bot=2', '--no-head', 'https://example.com'])
+    assert args.bots == 2
+    assert args.headless is False
+    assert args.url == 'https://example.com'
+
+
+@pytest.mark.parametrize('argv', [['--bots'], ['--bots=x'], ['--bots', 'x']])
+def test_bad_bots_value_exits_2(argv: list, capsys: pytest.CaptureFixture) -> None:
+    with pytest.raises(SystemExit) as exc:
+        _parse(argv)
+    assert exc.value.code == 2
+    assert 'argument --bots' in capsys.readouterr().err
+
+
+def test_unknown_option_exits_2() -> None:
+    with pytest.raises(SystemExit) as exc:
+        _parse(['--foo'])
+    assert exc.value.code == 2
+
+
+def test_double_dash_ends_options() -> None:
+    assert _parse(['--', '--foo']).url == '--foo'
+
+
+def test_second_positional_rejected() -> None:
+    with pytest.raises(SystemExit) as exc:
+        _parse(['https://a.example', 'https://b.example'])
+    assert exc.value.code == 2
+
+
+def test_help_exits_0(capsys: pytest.CaptureFixture) -> None:
+    with pytest.raises(SystemExit) as exc:
+        _parse(['-h'])
+    assert exc.value.code == 0
+    assert capsys.readouterr().out.startswith('usage:')